@@ -2,7 +2,7 @@ import asyncio
 import time
 
 from utils.network import get_profile_info, ping_all_accounts
-from utils.services import get_proxy_choice, assign_proxies
+from utils.services import get_proxy_choice, assign_proxies, close_sessions
 from utils.services import processed_tokens, load_tokens, send_request
 from utils.settings import ACTIVATE_ACCOUNTS, DAILY_CLAIM, logger, Fore
 from utils.settings import DOMAIN_API, CONNECTION_STATES, setup_logging, startup_art
@@ -80,6 +80,8 @@ async def clean_up_resources():
     
     cleaning_up = True
 
+    await close_sessions()
+
     for task in asyncio.all_tasks():
         if not task.done():
             task.cancel()
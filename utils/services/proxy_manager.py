@@ -1,11 +1,18 @@
 import os
 import sys
 import ssl
+import socket
 import json
+import time
+import random
 import asyncio
-from typing import List, Tuple, Optional, Any
-from urllib.parse import urlparse, urlunparse
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Awaitable, Callable, Dict, List, Tuple, Optional, Union, Any
+from urllib.parse import urlparse, urlunparse, ParseResult
 import aiohttp
+from aiohttp import BasicAuth
+from yarl import URL
 
 from utils.settings import logger, Fore
 
@@ -16,14 +23,126 @@ try:
 except Exception:
     _HAS_AIOHTTP_SOCKS = False
 
+# Optional async DNS (install aiodns to avoid getaddrinfo in a thread pool)
+try:
+    import aiodns  # type: ignore  # noqa: F401
+    _HAS_AIODNS = True
+except Exception:
+    _HAS_AIODNS = False
+
+# Optional httpx backend for the direct route and HTTP(S) proxies (install
+# httpx, plus h2 for HTTP/2). aiohttp remains the fallback and SOCKS backend.
+# AsyncClient(proxy=...) needs httpx 0.26+.
+try:
+    import httpx  # type: ignore
+    _HAS_HTTPX = tuple(int(p) for p in httpx.__version__.split(".")[:2]) >= (0, 26)
+except Exception:
+    _HAS_HTTPX = False
+
+# Errors logged as a lookup timeout rather than a generic failure
+_TIMEOUT_ERRORS: Tuple[type, ...] = (asyncio.TimeoutError,)
+if _HAS_HTTPX:
+    _TIMEOUT_ERRORS += (httpx.TimeoutException,)
+
+try:
+    import h2  # type: ignore  # noqa: F401
+    _HAS_H2 = True
+except Exception:
+    _HAS_H2 = False
+
+# Optional fast JSON decoding (install orjson), falls back to the stdlib
+try:
+    import orjson  # type: ignore
+    _json_loads = orjson.loads
+except Exception:
+    _json_loads = json.loads
+
 PROXIES_FILE = "proxies.txt"
 TOKENS_FILE = "tokens.txt"
 
+# IP lookup endpoint, built once so requests skip URL construction
+_IPIFY_URL = URL("https://api.ipify.org?format=json")
+_IPIFY_HOST = _IPIFY_URL.host
+
+# Parsed proxy files: path -> (mtime, size, proxies)
+_PROXY_CACHE: Dict[str, Tuple[float, int, List[str]]] = {}
+
+# Shared unverified SSL context, see create_ssl_context()
+_SSL_CTX: Optional[ssl.SSLContext] = None
+
+# Shared client sessions, keyed by SOCKS proxy URL or "__direct__".
+# HTTP(S) proxies reuse the direct session: aiohttp keys pooled
+# connections by proxy and proxy auth, so they are never mixed up.
+_SESSIONS: Dict[str, aiohttp.ClientSession] = {}
+_DIRECT_KEY = "__direct__"
+
+# Shared httpx clients, keyed by HTTP(S) proxy URL or "__direct__". httpx
+# binds the proxy to the client, so each proxy needs its own pool.
+_HTTPX_CLIENTS: Dict[str, Any] = {}
+
+# Resolved IPs keyed by proxy URL or "__direct__": key -> (expires_at, ip).
+# Failed lookups are cached briefly so broken proxies are not hammered.
+_IP_CACHE: Dict[str, Tuple[float, str]] = {}
+IP_CACHE_TTL = 300
+IP_NEGATIVE_TTL = 30
+
+# Lookups in flight, keyed like _IP_CACHE
+_IP_INFLIGHT: Dict[str, "asyncio.Future[str]"] = {}
+
+# Per-host cap on concurrent IP lookup requests
+HOST_CONCURRENCY = 64
+_HOST_SEMAPHORES: Dict[str, asyncio.Semaphore] = {}
+
+# (level, option, value) tuples applied to every new pooled socket. asyncio
+# already enables TCP_NODELAY on TCP transports; it is listed so the
+# guarantee does not depend on the loop or connector implementation.
+SOCKET_OPTIONS: List[Tuple[int, int, int]] = [(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)]
+
+
+def _apply_socket_options(transport: Any, options: List[Tuple[int, int, int]]) -> None:
+    """Apply socket options to the raw socket behind an asyncio transport."""
+    sock = transport.get_extra_info("socket") if transport is not None else None
+    if sock is None:
+        return
+    for level, option, value in options:
+        try:
+            sock.setsockopt(level, option, value)
+        except OSError:
+            pass
+
+
+class _SocketOptionsMixin:
+    """Connector mixin that applies SOCKET_OPTIONS once to each new connection."""
+
+    async def _create_connection(self, req, traces, timeout):
+        proto = await super()._create_connection(req, traces, timeout)
+        _apply_socket_options(proto.transport, SOCKET_OPTIONS)
+        return proto
+
+
+class _TCPConnector(_SocketOptionsMixin, aiohttp.TCPConnector):
+    pass
+
+
+if _HAS_AIOHTTP_SOCKS:
+    class _ProxyConnector(_SocketOptionsMixin, ProxyConnector):
+        pass
 
+
+@lru_cache(maxsize=None)
+def _parse(url: str) -> ParseResult:
+    """
+    Memoized urlparse; the same proxy URLs are parsed on every lookup.
+    Unbounded so load_proxies can warm every line of a large proxies file.
+    """
+    return urlparse(url)
+
+
+@lru_cache(maxsize=1024)
 def _mask_proxy(proxy: str) -> str:
     """Return a masked version of a proxy for safe logging."""
     try:
-        p = urlparse(proxy)
+        p = _parse(proxy)
         host = p.hostname or "unknown"
         port = p.port or ""
         user = p.username or ""
@@ -34,18 +153,73 @@ def _mask_proxy(proxy: str) -> str:
         return "masked-proxy"
 
 
+@dataclass(frozen=True)
+class ProxyRec:
+    """Connection details for a proxy, derived once from its raw URL."""
+    # Declared by hand: dataclass(slots=True) needs Python 3.10+
+    __slots__ = ("raw", "scheme", "host", "port", "no_auth_url", "auth", "is_socks")
+
+    raw: str
+    scheme: str
+    host: str
+    port: int
+    no_auth_url: str
+    auth: Optional[BasicAuth]
+    is_socks: bool
+
+
+@lru_cache(maxsize=None)
+def _proxy_record(raw: str) -> Optional[ProxyRec]:
+    """Build a ProxyRec from a proxy URL, or None if the URL is invalid."""
+    # ParseResult.hostname/port/username/password re-split the netloc on
+    # every access, so read each of them exactly once.
+    try:
+        parsed = _parse(raw)
+        host, port = parsed.hostname, parsed.port
+        if not parsed.scheme or not host or not port:
+            return None
+    except ValueError:
+        return None
+
+    scheme = parsed.scheme.lower()
+    username, password = parsed.username, parsed.password
+    auth = None
+    if username or password:
+        auth = BasicAuth(username or "", password or "")
+
+    return ProxyRec(
+        raw=raw,
+        scheme=scheme,
+        host=host,
+        port=port,
+        no_auth_url=urlunparse((parsed.scheme, f"{host}:{port}", "", "", "", "")),
+        auth=auth,
+        is_socks=scheme.startswith("socks"),
+    )
+
+
 def load_proxies(path: str = PROXIES_FILE) -> List[str]:
     """
     Load proxies from a file. Each non-empty line is a proxy string.
     Strips surrounding quotes and whitespace.
+    The parsed list is cached until the file's mtime or size changes.
     """
     try:
-        with open(path, "r", encoding="utf-8") as f:
-            lines = [ln.strip() for ln in f.read().splitlines()]
-        proxies = [ln.strip('"').strip("'") for ln in lines if ln and not ln.isspace()]
+        st = os.stat(path)
+        cached = _PROXY_CACHE.get(path)
+        if cached is not None and cached[:2] == (st.st_mtime, st.st_size):
+            proxies = cached[2]
+        else:
+            with open(path, "r", encoding="utf-8") as f:
+                proxies = [s for s in (ln.strip().strip("'\"") for ln in f) if s]
+            _PROXY_CACHE[path] = (st.st_mtime, st.st_size, proxies)
+            # Precompute connection details so IP lookups skip parsing
+            for proxy in proxies:
+                _proxy_record(proxy)
+
         if not proxies:
             logger.warning(f"{Fore.CYAN}00{Fore.RESET} - {Fore.YELLOW}No proxies found in {path}. Running without proxies{Fore.RESET}")
-        return proxies
+        return list(proxies)
     except FileNotFoundError:
         logger.warning(f"{Fore.CYAN}00{Fore.RESET} - {Fore.YELLOW}File {path} not found. Running without proxies{Fore.RESET}")
         return []
@@ -124,87 +298,348 @@ def get_proxy_ip(proxy_url: Optional[str]) -> str:
     try:
         if not proxy_url:
             return "Unknown"
-        return urlparse(proxy_url).hostname or "Unknown"
+        return _parse(proxy_url).hostname or "Unknown"
     except Exception:
         return "Unknown"
 
 
 def create_ssl_context() -> ssl.SSLContext:
-    """Create an SSL context that does not verify certificates (useful for self-signed)."""
-    ctx = ssl.create_default_context()
-    ctx.check_hostname = False
-    ctx.verify_mode = ssl.CERT_NONE
-    return ctx
+    """
+    Return the shared SSL context that does not verify certificates (useful for self-signed).
+    Built on first use; every connector reuses the same instance.
+    """
+    global _SSL_CTX
+    if _SSL_CTX is None:
+        ctx = ssl.create_default_context()
+        ctx.check_hostname = False
+        ctx.verify_mode = ssl.CERT_NONE
+        _SSL_CTX = ctx
+    return _SSL_CTX
+
+
+def _make_resolver() -> Optional[aiohttp.abc.AbstractResolver]:
+    """
+    Return an aiodns-backed AsyncResolver, or None to keep aiohttp's default.
+    aiodns only works on a SelectorEventLoop on Windows, where asyncio.run()
+    defaults to the Proactor loop, so it is skipped there.
+    """
+    if not _HAS_AIODNS:
+        return None
+    if sys.platform == "win32" and not isinstance(asyncio.get_running_loop(), asyncio.SelectorEventLoop):
+        return None
+    try:
+        return aiohttp.AsyncResolver()
+    except Exception as e:
+        logger.debug(f"{Fore.CYAN}00{Fore.RESET} - AsyncResolver unavailable, using default resolver: {e}")
+        return None
+
+
+async def _get_session(rec: Optional[ProxyRec] = None) -> aiohttp.ClientSession:
+    """
+    Return a cached ClientSession for the given proxy, creating it on first use.
+    SOCKS proxies get their own session since the proxy lives in the connector.
+    """
+    is_socks = rec is not None and rec.is_socks
+    key = rec.raw if is_socks else _DIRECT_KEY
+
+    session = _SESSIONS.get(key)
+    if session is not None and not session.closed:
+        return session
 
+    connector_kwargs = dict(
+        ssl=create_ssl_context(),
+        limit=128,
+        limit_per_host=64,
+        ttl_dns_cache=300,
+        use_dns_cache=True,
+    )
+    resolver = _make_resolver()
+    if resolver is not None:
+        connector_kwargs["resolver"] = resolver
 
-async def get_ip_address(proxy: Optional[str] = None, timeout: int = 10) -> str:
+    if is_socks:
+        connector = _ProxyConnector.from_url(rec.raw, **connector_kwargs)
+    else:
+        connector = _TCPConnector(**connector_kwargs)
+    session = aiohttp.ClientSession(connector=connector)
+    _SESSIONS[key] = session
+    return session
+
+
+def _get_httpx_client(rec: Optional[ProxyRec] = None) -> "httpx.AsyncClient":
+    """Return a cached httpx client for the given HTTP(S) proxy, creating it on first use."""
+    key = rec.raw if rec is not None else _DIRECT_KEY
+    client = _HTTPX_CLIENTS.get(key)
+    if client is not None and not client.is_closed:
+        return client
+
+    client = httpx.AsyncClient(
+        http2=_HAS_H2,
+        limits=httpx.Limits(max_connections=256, max_keepalive_connections=128),
+        # Not _SSL_CTX: httpcore sets h2 ALPN on the context it is given,
+        # which would make aiohttp (HTTP/1.1 only) negotiate h2 on it too.
+        verify=False,
+        proxy=rec.raw if rec is not None else None,
+        trust_env=False,
+    )
+    _HTTPX_CLIENTS[key] = client
+    return client
+
+
+async def close_sessions() -> None:
+    """Close all shared client sessions. Call once on shutdown."""
+    sessions = list(_SESSIONS.values())
+    _SESSIONS.clear()
+    for session in sessions:
+        try:
+            await session.close()
+        except Exception as e:
+            logger.debug(f"{Fore.CYAN}00{Fore.RESET} - Failed to close session: {e}")
+
+    clients = list(_HTTPX_CLIENTS.values())
+    _HTTPX_CLIENTS.clear()
+    for client in clients:
+        try:
+            await client.aclose()
+        except Exception as e:
+            logger.debug(f"{Fore.CYAN}00{Fore.RESET} - Failed to close httpx client: {e}")
+
+
+async def get_ip_address(proxy: Union[str, ProxyRec, None] = None, timeout: int = 10) -> str:
     """
-    Get public IP address optionally through a proxy.
+    Get public IP address optionally through a proxy, given as a URL or ProxyRec.
     Handles HTTP(S) proxies with proxy_auth and SOCKS proxies if aiohttp_socks is installed.
+    Results are cached per proxy for IP_CACHE_TTL seconds (IP_NEGATIVE_TTL on failure).
     Returns the IP string or 'Unknown' on failure.
     """
-    proxy_ip = "Unknown"
+    rec = None
+    if isinstance(proxy, ProxyRec):
+        rec = proxy
+    elif proxy:
+        proxy = proxy.strip()
+        rec = _proxy_record(proxy)
+        if rec is None:
+            logger.warning(f"{Fore.CYAN}00{Fore.RESET} - {Fore.YELLOW}Invalid proxy format: {proxy}{Fore.RESET}")
+
+    key = rec.raw if rec is not None else _DIRECT_KEY
+    cached = _IP_CACHE.get(key)
+    if cached is not None and cached[0] > time.monotonic():
+        return cached[1]
+
+    # Concurrent callers for the same key share one lookup
+    task = _IP_INFLIGHT.get(key)
+    if task is None:
+        task = asyncio.ensure_future(_fetch_and_cache_ip(key, rec, timeout))
+        _IP_INFLIGHT[key] = task
+        task.add_done_callback(lambda t, k=key: _forget_inflight(k, t))
+    return await asyncio.shield(task)
+
+
+def _forget_inflight(key: str, task: "asyncio.Future[str]") -> None:
+    """Drop a finished lookup from _IP_INFLIGHT unless it was already replaced."""
+    if _IP_INFLIGHT.get(key) is task:
+        del _IP_INFLIGHT[key]
+
+
+async def _fetch_and_cache_ip(key: str, rec: Optional[ProxyRec], timeout: int) -> str:
+    """Look up the IP and cache it, with the TTL measured from completion."""
+    ip, ok = await _fetch_ip_address(rec, timeout)
+    _IP_CACHE[key] = (time.monotonic() + (IP_CACHE_TTL if ok else IP_NEGATIVE_TTL), ip)
+    return ip
+
+
+def invalidate_ip_cache(proxy: Optional[str] = None) -> None:
+    """Drop the cached IP for a proxy, or the whole cache if no proxy is given."""
+    if proxy is None:
+        _IP_CACHE.clear()
+    else:
+        _IP_CACHE.pop(proxy.strip(), None)
+
+
+def _host_sem(host: str) -> asyncio.Semaphore:
+    """Return the shared semaphore limiting concurrent requests to a host."""
+    sem = _HOST_SEMAPHORES.get(host)
+    if sem is None:
+        sem = _HOST_SEMAPHORES[host] = asyncio.Semaphore(HOST_CONCURRENCY)
+    return sem
+
+
+def _retry_delay(attempt: int, retry_after: Optional[str], base: float, cap: float) -> float:
+    """Honour a numeric Retry-After header, else use capped exponential backoff with jitter."""
+    if retry_after:
+        try:
+            return min(cap, max(0.0, float(retry_after)))
+        except ValueError:
+            pass
+    return min(cap, base * 2 ** (attempt - 1)) * random.uniform(0.5, 1.5)
+
+
+_AIOHTTP_RETRY_ON = (aiohttp.ClientError, asyncio.TimeoutError)
+
+# A single request attempt: takes the seconds left before the deadline and
+# returns (data, status, Retry-After header). data is decoded JSON or None.
+_Attempt = Callable[[float], Awaitable[Tuple[Optional[Any], int, Optional[str]]]]
+
+
+async def _fetch_with_retries(
+    attempt_request: _Attempt,
+    host: str,
+    deadline: float,
+    retry_on: Tuple[type, ...],
+    retries: int = 3,
+    base_delay: float = 0.5,
+    max_delay: float = 10.0,
+) -> Tuple[Optional[Any], Optional[int]]:
+    """
+    Run a request, retrying on 429, 5xx and `retry_on` errors.
+    All attempts and backoff share one deadline (event loop time); running
+    out of time raises asyncio.TimeoutError.
+    Returns (data, status); data is None if every attempt failed.
+    The last connection error is re-raised once retries are exhausted.
+    """
+    loop = asyncio.get_running_loop()
+    status = None
+    for attempt in range(1, retries + 1):
+        remaining = deadline - loop.time()
+        if remaining <= 0:
+            raise asyncio.TimeoutError()
+        # Time spent queued on the per-host limit counts against the deadline
+        sem = _host_sem(host)
+        await asyncio.wait_for(sem.acquire(), remaining)
+        retry_after = None
+        try:
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                raise asyncio.TimeoutError()
+            data, status, retry_after = await attempt_request(remaining)
+            if status >= 500:
+                retry_after = None
+            elif status != 429:
+                return data, status
+        except retry_on:
+            if attempt == retries or loop.time() >= deadline:
+                raise
+        finally:
+            sem.release()
+
+        if attempt < retries:
+            delay = _retry_delay(attempt, retry_after, base_delay, max_delay)
+            if loop.time() + delay >= deadline:
+                break
+            await asyncio.sleep(delay)
+    return None, status
+
+
+def _aiohttp_attempt(session: aiohttp.ClientSession, **kwargs: Any) -> _Attempt:
+    """Build a single IP lookup attempt on an aiohttp session."""
+    async def attempt_request(remaining: float) -> Tuple[Optional[Any], int, Optional[str]]:
+        async with session.get(_IPIFY_URL, timeout=aiohttp.ClientTimeout(total=remaining), **kwargs) as resp:
+            data = None
+            if resp.status == 200 and resp.content_type == "application/json":
+                data = _json_loads(await resp.read())
+            return data, resp.status, resp.headers.get("Retry-After")
+    return attempt_request
+
+
+def _httpx_attempt(client: "httpx.AsyncClient") -> _Attempt:
+    """Build a single IP lookup attempt on an httpx client."""
+    url = str(_IPIFY_URL)
+
+    async def attempt_request(remaining: float) -> Tuple[Optional[Any], int, Optional[str]]:
+        # httpx applies a float timeout per phase, not in total
+        resp = await asyncio.wait_for(client.get(url, timeout=remaining), remaining)
+        data = None
+        if resp.status_code == 200 and resp.headers.get("content-type", "").startswith("application/json"):
+            data = _json_loads(resp.content)
+        return data, resp.status_code, resp.headers.get("Retry-After")
+    return attempt_request
+
+
+async def _lookup(attempt_request: _Attempt, deadline: float, retry_on: Tuple[type, ...], via_proxy: bool) -> Tuple[str, bool]:
+    """Run an IP lookup attempt with retries and turn the result into (ip, success)."""
+    data, status = await _fetch_with_retries(attempt_request, _IPIFY_HOST, deadline, retry_on)
+    if data is not None:
+        return data.get("ip", "Unknown"), True
+    prefix = "Proxy request" if via_proxy else "Request"
+    logger.warning(f"{Fore.CYAN}00{Fore.RESET} - {Fore.YELLOW}{prefix} returned status {status}{Fore.RESET}")
+    return "Unknown", False
+
+
+async def _fetch_httpx(rec: Optional[ProxyRec], deadline: float) -> Tuple[str, bool]:
+    """
+    Look up the public IP directly or through an HTTP(S) proxy using httpx.
+    Uses HTTP/2 when h2 is installed; falls back to aiohttp if the client
+    cannot be built.
+    """
     try:
-        # Clean proxy
-        if proxy:
-            proxy = proxy.strip()
-            parsed = urlparse(proxy)
-            if not parsed.scheme or not parsed.hostname or not parsed.port:
-                logger.warning(f"{Fore.CYAN}00{Fore.RESET} - {Fore.YELLOW}Invalid proxy format: {proxy}{Fore.RESET}")
-                proxy = None
-            else:
-                proxy_ip = parsed.hostname
-
-        url = "https://api.ipify.org?format=json"
-        ssl_context = create_ssl_context()
-
-        # If no proxy, simple request
-        if not proxy:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url, ssl=ssl_context, timeout=timeout) as resp:
-                    if resp.status == 200:
-                        data = await resp.json()
-                        return data.get("ip", "Unknown")
-                    logger.warning(f"{Fore.CYAN}00{Fore.RESET} - {Fore.YELLOW}Request returned status {resp.status}{Fore.RESET}")
-                    return "Unknown"
-
-        # Proxy present: parse and prepare
-        parsed = urlparse(proxy)
-        scheme = parsed.scheme.lower()
-
-        # If SOCKS and aiohttp_socks available, use ProxyConnector
-        if scheme.startswith("socks"):
-            if not _HAS_AIOHTTP_SOCKS:
-                logger.error(f"{Fore.CYAN}00{Fore.RESET} - {Fore.RED}SOCKS proxy requested but aiohttp_socks is not installed{Fore.RESET}")
-                return proxy_ip
-            # ProxyConnector.from_url accepts full URL with credentials
-            connector = ProxyConnector.from_url(proxy)
-            async with aiohttp.ClientSession(connector=connector) as session:
-                async with session.get(url, ssl=ssl_context, timeout=timeout) as resp:
-                    if resp.status == 200:
-                        data = await resp.json()
-                        return data.get("ip", "Unknown")
-                    logger.warning(f"{Fore.CYAN}00{Fore.RESET} - {Fore.YELLOW}Proxy request returned status {resp.status}{Fore.RESET}")
-                    return "Unknown"
-
-        # HTTP(S) proxy: separate credentials from proxy URL
-        proxy_no_auth = urlunparse((parsed.scheme, f"{parsed.hostname}:{parsed.port}", "", "", "", ""))
-        proxy_auth = None
-        if parsed.username or parsed.password:
-            from aiohttp import BasicAuth
-            proxy_auth = BasicAuth(parsed.username or "", parsed.password or "")
-
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url, proxy=proxy_no_auth, proxy_auth=proxy_auth, ssl=ssl_context, timeout=timeout) as resp:
-                if resp.status == 200:
-                    data = await resp.json()
-                    return data.get("ip", "Unknown")
-                logger.warning(f"{Fore.CYAN}00{Fore.RESET} - {Fore.YELLOW}Proxy request returned status {resp.status}{Fore.RESET}")
-                return "Unknown"
+        client = _get_httpx_client(rec)
+    except Exception as e:
+        logger.debug(f"{Fore.CYAN}00{Fore.RESET} - httpx client unavailable, using aiohttp: {e}")
+        if rec is None:
+            return await _fetch_direct(deadline)
+        return await _fetch_http(rec, deadline)
+
+    return await _lookup(_httpx_attempt(client), deadline, (httpx.TransportError,), rec is not None)
+
+
+async def _fetch_direct(deadline: float) -> Tuple[str, bool]:
+    """Look up the public IP without a proxy."""
+    session = await _get_session()
+    return await _lookup(_aiohttp_attempt(session), deadline, _AIOHTTP_RETRY_ON, False)
+
 
+async def _fetch_http(rec: ProxyRec, deadline: float) -> Tuple[str, bool]:
+    """Look up the public IP through an HTTP(S) proxy on the shared session."""
+    # Credentials are kept apart from the proxy URL
+    session = await _get_session()
+    attempt_request = _aiohttp_attempt(session, proxy=rec.no_auth_url, proxy_auth=rec.auth)
+    return await _lookup(attempt_request, deadline, _AIOHTTP_RETRY_ON, True)
+
+
+async def _fetch_socks(rec: ProxyRec, deadline: float) -> Tuple[str, bool]:
+    """Look up the public IP through a SOCKS proxy on its own ProxyConnector session."""
+    if not _HAS_AIOHTTP_SOCKS:
+        logger.error(f"{Fore.CYAN}00{Fore.RESET} - {Fore.RED}SOCKS proxy requested but aiohttp_socks is not installed{Fore.RESET}")
+        return rec.host, False
+    session = await _get_session(rec)
+    return await _lookup(_aiohttp_attempt(session), deadline, _AIOHTTP_RETRY_ON, True)
+
+
+# Proxy scheme -> IP lookup backend. Unlisted schemes go to _fetch_socks if
+# they start with "socks", otherwise to the active HTTP backend.
+_DISPATCH = {
+    "http": _fetch_http,
+    "https": _fetch_http,
+    "socks4": _fetch_socks,
+    "socks4a": _fetch_socks,
+    "socks5": _fetch_socks,
+    "socks5h": _fetch_socks,
+}
+if _HAS_HTTPX:
+    _DISPATCH.update(http=_fetch_httpx, https=_fetch_httpx)
+
+
+async def _fetch_ip_address(rec: Optional[ProxyRec], timeout: int) -> Tuple[str, bool]:
+    """
+    Perform the actual IP lookup. Returns (ip, success).
+    `timeout` bounds the whole lookup, including retries and backoff.
+    """
+    proxy_ip = rec.host if rec is not None else "Unknown"
+    try:
+        deadline = asyncio.get_running_loop().time() + timeout
+        if rec is None:
+            if _HAS_HTTPX:
+                return await _fetch_httpx(None, deadline)
+            return await _fetch_direct(deadline)
+        fetch = _DISPATCH.get(rec.scheme)
+        if fetch is None:
+            fetch = _fetch_socks if rec.is_socks else _DISPATCH["http"]
+        return await fetch(rec, deadline)
+    except _TIMEOUT_ERRORS:
+        logger.error(f"{Fore.CYAN}00{Fore.RESET} - {Fore.RED}Request via proxy {proxy_ip} timed out after {timeout} seconds{Fore.RESET}")
     except Exception as e:
         logger.error(f"{Fore.CYAN}00{Fore.RESET} - {Fore.RED}Request failed via proxy {proxy_ip}:{Fore.RESET} {e}")
-    return proxy_ip
+    return proxy_ip, False
 
 
 async def resolve_ip(account: Any) -> str:
@@ -224,3 +659,17 @@ async def resolve_ip(account: Any) -> str:
         except Exception:
             logger.error(f"{Fore.CYAN}00{Fore.RESET} - {Fore.RED}Failed to resolve proxy or IP address:{Fore.RESET} {e}")
         return "Unknown"
+
+
+async def resolve_ips(accounts: List[Any], concurrency: int = 64) -> List[str]:
+    """
+    Resolve IPs for many accounts concurrently, with at most `concurrency`
+    lookups in flight. Results are returned in the same order as `accounts`.
+    """
+    sem = asyncio.Semaphore(max(1, concurrency))
+
+    async def _one(account: Any) -> str:
+        async with sem:
+            return await resolve_ip(account)
+
+    return await asyncio.gather(*(_one(account) for account in accounts))
@@ -1,4 +1,5 @@
 import asyncio
+import os
 
 from utils.settings import logger, Fore
 
@@ -7,16 +8,25 @@ from utils.settings import logger, Fore
 processed_tokens = set()
 lock = asyncio.Lock()
 
+# Parsed tokens files: path -> (mtime, size, tokens)
+_TOKEN_CACHE = {}
+
 # Masks sensitive parts of a token
 def mask_token(token):
     return f"{token[:5]}--{token[-5:]}"
 
-# Load tokens from a file
-async def load_tokens():
+# Load tokens from a file, reusing the last result while the file is unchanged
+async def load_tokens(path='tokens.txt'):
     try:
-        with open('tokens.txt', 'r') as file:
-            tokens = file.read().splitlines()
-        return tokens
+        st = os.stat(path)
+        cached = _TOKEN_CACHE.get(path)
+        if cached is not None and cached[:2] == (st.st_mtime, st.st_size):
+            return list(cached[2])
+
+        with open(path, 'r', encoding='utf-8') as file:
+            tokens = [s for s in (ln.strip().strip("'\"") for ln in file) if s]
+        _TOKEN_CACHE[path] = (st.st_mtime, st.st_size, tokens)
+        return list(tokens)
     except Exception as e:
         logger.error(f"{Fore.CYAN}00{Fore.RESET} - {Fore.RED}Error loading tokens: {e}{Fore.RESET}")
         raise SystemExit("Exiting due to failure in loading tokens")